@@ -12,6 +12,7 @@ from config import (
     INDEX_DIR,
     INDEX_FILE,
     META_FILE,
+    BM25_FILE,
     PDF_PATH,
 )
 from qa_engine import QASystem, init_pipeline_if_needed
@@ -59,7 +60,12 @@ async def startup_event():
         except Exception:
             pass
     try:
-        qa = init_pipeline_if_needed(pdf_path=ACTIVE_PDF_PATH, index_file=INDEX_FILE, meta_file=META_FILE)
+        qa = init_pipeline_if_needed(
+            pdf_path=ACTIVE_PDF_PATH,
+            index_file=INDEX_FILE,
+            meta_file=META_FILE,
+            bm25_file=BM25_FILE,
+        )
     except FileNotFoundError:
         # PDF not present yet; keep API up for health check
         qa = None
@@ -94,5 +100,8 @@ async def root():
         "index_present": INDEX_FILE.exists() and META_FILE.exists(),
         "index_dir": str(INDEX_DIR),
         "pdf_path": str(ACTIVE_PDF_PATH),
+        "bm25_present": BM25_FILE.exists(),
     }
+    if qa is not None:
+        status["retrieval"] = qa.retrieval_stats()
     return status
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple
+from pathlib import Path
+from collections import Counter
+import hashlib
+import heapq
+import json
+import math
+
+from text_splitter import tokenize_basic
+
+
+def chunks_fingerprint(texts: List[str], seed: str = "") -> str:
+    # Chained hash so an index can extend a fingerprint it loaded from disk
+    fp = seed
+    for text in texts:
+        fp = hashlib.sha256((fp + "\0" + text).encode("utf-8")).hexdigest()
+    return fp
+
+
+class BM25Index:
+    """
+    Okapi BM25 inverted index over the same chunks stored in FAISSStore.
+
+    Document ids are chunk positions, so they line up with FAISSStore rows;
+    `fingerprint` identifies the exact chunk texts the index was built from.
+    Scores returned by `search` are normalized by the IDF sum of the query's
+    informative terms: 1.0 means every such term occurs once in an
+    average-length chunk, and repeated terms push a score above 1.0. Terms
+    below `min_idf` (stop-words, terms present in most chunks) are ignored
+    entirely, so generic questions get no lexical hits.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}  # term -> [(doc_id, tf)]
+        self.doc_lens: List[int] = []
+        self.fingerprint = ""
+        self._idf: Dict[str, float] = {}
+        self._weights: Dict[str, List[Tuple[int, float]]] = {}  # term -> [(doc_id, bm25 weight)]
+
+    @property
+    def num_docs(self) -> int:
+        return len(self.doc_lens)
+
+    def add(self, texts: List[str]) -> None:
+        for text in texts:
+            doc_id = len(self.doc_lens)
+            tokens = tokenize_basic(text)
+            self.doc_lens.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((doc_id, tf))
+        self.fingerprint = chunks_fingerprint(texts, seed=self.fingerprint)
+        self._finalize()
+
+    def _finalize(self) -> None:
+        # Precompute per-posting weights so a query only sums floats
+        n = self.num_docs
+        avgdl = (sum(self.doc_lens) / n) if n else 0.0
+        len_norm = [
+            self.k1 * (1.0 - self.b + self.b * (dl / avgdl if avgdl else 0.0))
+            for dl in self.doc_lens
+        ]
+        k1p1 = self.k1 + 1.0
+        self._idf = {}
+        self._weights = {}
+        for term, plist in self.postings.items():
+            idf = self._idf_for(len(plist))
+            self._idf[term] = idf
+            self._weights[term] = [
+                (doc_id, idf * tf * k1p1 / (tf + len_norm[doc_id])) for doc_id, tf in plist
+            ]
+
+    def _idf_for(self, df: int) -> float:
+        n = self.num_docs
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, top_k: int = 5, min_idf: float = 0.0) -> List[Tuple[float, int]]:
+        if not self.num_docs:
+            return []
+
+        # Unknown terms keep max IDF: missing a rare query term lowers confidence
+        max_idf = self._idf_for(0)
+        terms = [
+            t for t in set(tokenize_basic(query))
+            if self._idf.get(t, max_idf) >= min_idf
+        ]
+        if not terms:
+            return []
+        norm = sum(self._idf.get(t, max_idf) for t in terms)
+
+        scores: Dict[int, float] = {}
+        for term in terms:
+            for doc_id, w in self._weights.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + w
+
+        ranked = heapq.nlargest(top_k, scores.items(), key=lambda x: x[1])
+        return [(s / norm, doc_id) for doc_id, s in ranked]
+
+    def save(self, bm25_file: Path) -> None:
+        bm25_file.parent.mkdir(parents=True, exist_ok=True)
+        with bm25_file.open("w", encoding="utf-8") as f:
+            # k1/b are not stored: weights are recomputed on load with the caller's values
+            json.dump({
+                "fingerprint": self.fingerprint,
+                "doc_lens": self.doc_lens,
+                # Flattened [doc_id, tf, doc_id, tf, ...] keeps the file compact
+                "postings": {t: [x for p in plist for x in p] for t, plist in self.postings.items()},
+            }, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, bm25_file: Path, k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        if not bm25_file.exists():
+            raise FileNotFoundError("BM25 index not found")
+        with bm25_file.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(k1=k1, b=b)
+        index.fingerprint = str(data["fingerprint"])
+        index.doc_lens = [int(dl) for dl in data["doc_lens"]]
+        index.postings = {}
+        for t, flat in data["postings"].items():
+            if len(flat) % 2:
+                raise ValueError(f"Corrupt posting list for term {t!r}")
+            plist = list(zip(flat[0::2], flat[1::2]))
+            if any(not 0 <= d < index.num_docs for d, _ in plist):
+                raise ValueError(f"Posting for term {t!r} references unknown chunk")
+            index.postings[t] = plist
+        index._finalize()
+        return index
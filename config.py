@@ -7,6 +7,7 @@ PDF_PATH = DATA_DIR / "Taleem-ul-Islam.pdf"
 INDEX_DIR = BASE_DIR / "storage" / "faiss"
 INDEX_FILE = INDEX_DIR / "index.faiss"
 META_FILE = INDEX_DIR / "metadata.json"
+BM25_FILE = INDEX_DIR / "bm25.json"
 
 # Models
 EMBEDDING_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
@@ -23,6 +24,17 @@ TOP_K = 5
 SCORE_THRESHOLD = 0.30  # Cosine similarity threshold for a confident answer
 CONFIDENCE_CLARIFY_THRESHOLD = 0.20  # If below, ask user to clarify
 
+# Lexical (BM25) first stage
+# Scores are BM25 normalized by the IDF sum of the query's informative terms
+# (1.0 = each such term once in an average-length chunk). They gate only the
+# lexical short-circuit and never stand in for cosine similarity.
+BM25_K1 = 1.5
+BM25_B = 0.75
+BM25_MIN_IDF = 1.0  # Query terms present in more than ~37% of chunks are ignored
+BM25_SHORTCIRCUIT_SCORE = 0.9  # Normalized BM25 score at which dense retrieval is skipped
+BM25_SHORTCIRCUIT_MARGIN = 0.4  # Runner-up must score at least this fraction below the top hit
+BM25_FUSION_WEIGHT = 0.25  # Weight of normalized BM25 score in the fused ranking (not in thresholds)
+
 # API
 CORS_ORIGINS = [
     "*"  # Adjust for production
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import List, Tuple, Optional, Dict
 from pathlib import Path
 from collections import defaultdict
+import json
 import re
 
 import numpy as np
@@ -10,9 +11,16 @@ from config import (
     PDF_PATH,
     INDEX_FILE,
     META_FILE,
+    BM25_FILE,
     TOP_K,
     SCORE_THRESHOLD,
     CONFIDENCE_CLARIFY_THRESHOLD,
+    BM25_K1,
+    BM25_B,
+    BM25_MIN_IDF,
+    BM25_SHORTCIRCUIT_SCORE,
+    BM25_SHORTCIRCUIT_MARGIN,
+    BM25_FUSION_WEIGHT,
     EMBEDDING_MODEL_NAME,
     EN_TO_UR_MODEL,
     UR_TO_EN_MODEL,
@@ -22,9 +30,10 @@ from config import (
     CLARIFY_EN,
 )
 from pdf_loader import load_pdf_text
-from text_splitter import split_pages_into_chunks
+from text_splitter import split_pages_into_chunks, tokenize_basic
 from embeddings import EmbeddingModel
 from vector_store import FAISSStore
+from bm25_index import BM25Index, chunks_fingerprint
 from translator import Translator
 from language_detector import LanguageDetector
 from question_rewriter import QuestionRewriter
@@ -40,12 +49,66 @@ class QASystem:
         translator: Translator,
         normalizer: QuestionNormalizer,
         ambiguity: AmbiguityChecker,
+        bm25: Optional[BM25Index] = None,
     ) -> None:
         self.store = store
         self.embedder = embedder
         self.translator = translator
         self.normalizer = normalizer
         self.ambiguity = ambiguity
+        self.bm25 = bm25
+        # Retrieval counters: questions that reached retrieval vs. ones answered lexically
+        self.retrievals = 0
+        self.embeddings_skipped = 0
+
+    def retrieval_stats(self) -> Dict:
+        ratio = (self.embeddings_skipped / self.retrievals) if self.retrievals else 0.0
+        return {
+            "retrievals": self.retrievals,
+            "embeddings_skipped": self.embeddings_skipped,
+            "embedding_skip_ratio": round(ratio, 4),
+        }
+
+    def retrieve(self, q_ur: str, top_k: int = TOP_K) -> Tuple[List[Tuple[float, str, Dict]], bool]:
+        """
+        Return (results, lexical_only).
+
+        When lexical_only is True the results are BM25 hits that cleared the
+        short-circuit gate and carry normalized BM25 scores. Otherwise every
+        score is a raw cosine similarity; BM25 only influences the ranking.
+        """
+        self.retrievals += 1
+        lexical: List[Tuple[float, int]] = []
+        if self.bm25 is not None:
+            lexical = self.bm25.search(q_ur, top_k=top_k, min_idf=BM25_MIN_IDF)
+
+        # Confident and unambiguous lexical hit: skip the embedding pass
+        if lexical and lexical[0][0] >= BM25_SHORTCIRCUIT_SCORE and (
+            len(lexical) == 1
+            or lexical[1][0] <= lexical[0][0] * (1.0 - BM25_SHORTCIRCUIT_MARGIN)
+        ):
+            self.embeddings_skipped += 1
+            return [
+                (s, self.store.texts[i], self.store.metas[i])
+                for s, i in lexical if s >= BM25_SHORTCIRCUIT_SCORE
+            ], True
+
+        q_vec = self.embedder.encode_one(q_ur, normalize=True).astype(np.float32)
+        dense = self.store.search_ids(q_vec, top_k=top_k)
+        if not lexical:
+            return [(s, self.store.texts[i], self.store.metas[i]) for s, i in dense], False
+
+        # Rank the union of candidates by cosine plus a lexical boost, but keep cosine as the score
+        cosine = {i: s for s, i in dense}
+        lex_scores = {i: s for s, i in lexical}
+        missing = [i for i in lex_scores if i not in cosine]
+        cosine.update(zip(missing, self.store.score_ids(q_vec, missing)))
+        ranked = sorted(
+            cosine.items(),
+            key=lambda x: x[1] + BM25_FUSION_WEIGHT * lex_scores.get(x[0], 0.0),
+            reverse=True,
+        )
+        return [(s, self.store.texts[i], self.store.metas[i]) for i, s in ranked[:top_k]], False
 
     def answer(self, question: str, language: str = "urdu") -> Tuple[str, Optional[str]]:
         # 1) Normalize & rewrite question to formal Urdu
@@ -56,18 +119,21 @@ class QASystem:
         if ambiguous:
             return (CLARIFY_EN if language == "english" else CLARIFY_UR), None
 
-        q_vec = self.embedder.encode_one(q_ur, normalize=True).astype(np.float32)
-        results = self.store.search(q_vec, top_k=TOP_K)
+        results, lexical_only = self.retrieve(q_ur, top_k=TOP_K)
 
-        # Confidence control: if top score is too low, ask to clarify
-        best_score = results[0][0] if results else 0.0
-        if best_score < CONFIDENCE_CLARIFY_THRESHOLD:
-            return (CLARIFY_EN if language == "english" else CLARIFY_UR), None
+        if lexical_only:
+            # Already gated by BM25_SHORTCIRCUIT_SCORE; cosine thresholds do not apply
+            filtered = results
+        else:
+            # Confidence control: if top score is too low, ask to clarify
+            best_score = max((s for s, _, _ in results), default=0.0)
+            if best_score < CONFIDENCE_CLARIFY_THRESHOLD:
+                return (CLARIFY_EN if language == "english" else CLARIFY_UR), None
 
-        # Apply strict score threshold for answerability
-        filtered = [(s, t, m) for s, t, m in results if s >= SCORE_THRESHOLD]
-        if not filtered:
-            return (DEFAULT_NOT_FOUND_EN if language == "english" else DEFAULT_NOT_FOUND_UR), None
+            # Apply strict score threshold for answerability
+            filtered = [(s, t, m) for s, t, m in results if s >= SCORE_THRESHOLD]
+            if not filtered:
+                return (DEFAULT_NOT_FOUND_EN if language == "english" else DEFAULT_NOT_FOUND_UR), None
 
         answer_ur = synthesize_answer_urdu(q_ur, filtered)
         if not answer_ur.strip():
@@ -89,13 +155,19 @@ class QASystem:
         return answer_ur, source
 
 
-def init_pipeline_if_needed(pdf_path: Path, index_file: Path, meta_file: Path) -> QASystem:
+def init_pipeline_if_needed(
+    pdf_path: Path,
+    index_file: Path,
+    meta_file: Path,
+    bm25_file: Path = BM25_FILE,
+) -> QASystem:
     # Initialize embedder first to know the dimension
     embedder = EmbeddingModel(EMBEDDING_MODEL_NAME)
     dim = embedder.model.get_sentence_embedding_dimension()
 
     if index_file.exists() and meta_file.exists():
         store = FAISSStore.load(index_file, meta_file)
+        bm25 = load_bm25_if_current(bm25_file, store.texts)
     else:
         # Build index from PDF
         pages = load_pdf_text(pdf_path)
@@ -106,28 +178,40 @@ def init_pipeline_if_needed(pdf_path: Path, index_file: Path, meta_file: Path) -
         store = FAISSStore(dim)
         store.add(vecs, texts, metas)
         store.save(index_file, meta_file)
+        bm25 = None  # Chunks changed: never reuse a lexical index from a previous build
+
+    if bm25 is None:
+        # Lexical index is cheap to build from stored chunks; no re-embedding needed
+        bm25 = BM25Index(k1=BM25_K1, b=BM25_B)
+        bm25.add(store.texts)
+        try:
+            bm25.save(bm25_file)
+        except OSError:
+            # Read-only or full storage: keep serving from the in-memory index
+            pass
 
     translator = Translator(EN_TO_UR_MODEL, UR_TO_EN_MODEL)
     detector = LanguageDetector()
     rewriter = QuestionRewriter()
     normalizer = QuestionNormalizer(detector=detector, translator=translator, rewriter=rewriter)
     ambiguity = AmbiguityChecker()
-    return QASystem(store=store, embedder=embedder, translator=translator, normalizer=normalizer, ambiguity=ambiguity)
+    return QASystem(store=store, embedder=embedder, translator=translator, normalizer=normalizer, ambiguity=ambiguity, bm25=bm25)
 
 
-# ---- Answer synthesis (extractive, conservative) ----
+def load_bm25_if_current(bm25_file: Path, texts: List[str]) -> Optional[BM25Index]:
+    # The BM25 file is a rebuildable cache: treat missing, corrupt or stale files alike
+    try:
+        bm25 = BM25Index.load(bm25_file, k1=BM25_K1, b=BM25_B)
+    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError):
+        return None
+    if bm25.fingerprint != chunks_fingerprint(texts):
+        return None
+    return bm25
 
-_SENT_SPLIT_RE = re.compile(r"([\.\!\?\u06D4])")  # . ! ? Urdu full stop 
-_WS_RE = re.compile(r"\s+")
-_PUNCT_RE = re.compile(r"[\.,!\?\-:\u06D4\u061F\u060C\(\)\[\]\{\}\"\']")
 
+# ---- Answer synthesis (extractive, conservative) ----
 
-def tokenize_basic(text: str) -> List[str]:
-    text = _PUNCT_RE.sub(" ", text)
-    text = _WS_RE.sub(" ", text).strip()
-    if not text:
-        return []
-    return text.split(" ")
+_SENT_SPLIT_RE = re.compile(r"([\.\!\?\u06D4])")  # . ! ? Urdu full stop 
 
 
 def split_sentences(text: str) -> List[str]:
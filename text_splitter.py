@@ -1,3 +1,4 @@
+import re
 from typing import List, Dict
 from config import CHUNK_SIZE, CHUNK_OVERLAP
 
@@ -29,3 +30,15 @@ def split_pages_into_chunks(pages: List[tuple]) -> List[Dict]:
             if start < 0:
                 start = 0
     return chunks
+
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[\.,!\?\-:\u06D4\u061F\u060C\(\)\[\]\{\}\"\']")
+
+
+def tokenize_basic(text: str) -> List[str]:
+    text = _PUNCT_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
+    if not text:
+        return []
+    return text.split(" ")
@@ -24,6 +24,9 @@ class FAISSStore:
         self.metas.extend(metas)
 
     def search(self, query_vec: np.ndarray, top_k: int = 5) -> List[Tuple[float, str, Dict]]:
+        return [(s, self.texts[idx], self.metas[idx]) for s, idx in self.search_ids(query_vec, top_k)]
+
+    def search_ids(self, query_vec: np.ndarray, top_k: int = 5) -> List[Tuple[float, int]]:
         if query_vec.ndim == 1:
             query_vec = query_vec.reshape(1, -1)
         if query_vec.dtype != np.float32:
@@ -31,13 +34,21 @@ class FAISSStore:
         D, I = self.index.search(query_vec, top_k)
         scores = D[0].tolist()
         idxs = I[0].tolist()
-        results: List[Tuple[float, str, Dict]] = []
+        results: List[Tuple[float, int]] = []
         for s, idx in zip(scores, idxs):
             if idx == -1:
                 continue
-            results.append((float(s), self.texts[idx], self.metas[idx]))
+            results.append((float(s), idx))
         return results
 
+    def score_ids(self, query_vec: np.ndarray, ids: List[int]) -> List[float]:
+        # Exact inner product against stored vectors (flat index supports reconstruct)
+        if not ids:
+            return []
+        query_vec = query_vec.reshape(-1).astype(np.float32)
+        vecs = np.stack([self.index.reconstruct(int(i)) for i in ids])
+        return (vecs @ query_vec).astype(float).tolist()
+
     def save(self, index_file: Path, meta_file: Path) -> None:
         index_file.parent.mkdir(parents=True, exist_ok=True)
         faiss.write_index(self.index, str(index_file))